@@ -0,0 +1,88 @@
+//! Optional accelerator for pptx-translate's part loader.
+//!
+//! Exposes `parse_slide_xml(bytes)` which walks raw slide XML with
+//! quick-xml and returns `(text, fingerprint, node_index)` for every
+//! translatable `a:t` node. The filter and fingerprint must stay in
+//! lock-step with the Python fallback in translator.py: letter-free
+//! text is skipped, fingerprints are 128-bit blake2b over UTF-8, and
+//! `node_index` counts all `a:t` nodes in document order so the Python
+//! side can index into its own parsed element list.
+
+use blake2::digest::consts::U16;
+use blake2::{Blake2b, Digest};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use quick_xml::events::Event;
+use quick_xml::name::ResolveResult;
+use quick_xml::reader::NsReader;
+
+const DRAWINGML_NS: &[u8] = b"http://schemas.openxmlformats.org/drawingml/2006/main";
+
+/// Mirrors translator._UNTRANSLATABLE_RE: text with no letters at all
+/// reads the same in every language and never reaches the backend.
+fn is_translatable(text: &str) -> bool {
+    text.chars().any(|c| c.is_alphabetic())
+}
+
+#[pyfunction]
+fn parse_slide_xml<'py>(
+    py: Python<'py>,
+    data: &[u8],
+) -> PyResult<Vec<(String, Bound<'py, PyBytes>, usize)>> {
+    let mut reader = NsReader::from_reader(data);
+    let mut buf = Vec::new();
+    let mut out = Vec::new();
+    let mut node_index: usize = 0;
+    let mut capture: Option<String> = None;
+
+    loop {
+        let (resolved, event) = reader
+            .read_resolved_event_into(&mut buf)
+            .map_err(|err| PyValueError::new_err(format!("malformed part XML: {err}")))?;
+        match event {
+            Event::Start(ref start) => {
+                let is_a_t = start.local_name().as_ref() == b"t"
+                    && matches!(resolved, ResolveResult::Bound(ns) if ns.as_ref() == DRAWINGML_NS);
+                capture = is_a_t.then(String::new);
+            }
+            Event::Text(ref text) => {
+                if let Some(acc) = capture.as_mut() {
+                    let chunk = text
+                        .unescape()
+                        .map_err(|err| PyValueError::new_err(format!("malformed part XML: {err}")))?;
+                    acc.push_str(&chunk);
+                }
+            }
+            Event::End(ref end) if end.local_name().as_ref() == b"t" => {
+                if let Some(text) = capture.take() {
+                    if is_translatable(&text) {
+                        let mut hasher = Blake2b::<U16>::new();
+                        hasher.update(text.as_bytes());
+                        let digest = hasher.finalize();
+                        out.push((text, PyBytes::new_bound(py, &digest), node_index));
+                    }
+                    node_index += 1;
+                }
+            }
+            Event::Empty(ref empty) => {
+                // <a:t/> still occupies a slot in the document-order count.
+                if empty.local_name().as_ref() == b"t"
+                    && matches!(resolved, ResolveResult::Bound(ns) if ns.as_ref() == DRAWINGML_NS)
+                {
+                    node_index += 1;
+                }
+            }
+            Event::Eof => break,
+            _ => {}
+        }
+        buf.clear();
+    }
+    Ok(out)
+}
+
+#[pymodule]
+fn _native(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(parse_slide_xml, m)?)?;
+    Ok(())
+}
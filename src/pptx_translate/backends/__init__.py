@@ -1,5 +1,17 @@
 from .base import TranslationBackend
-from .dummy import DummyBackend
-from .openai_backend import OpenAIBackend
 
 __all__ = ["TranslationBackend", "DummyBackend", "OpenAIBackend"]
+
+
+def __getattr__(name):
+    # Defer backend imports (openai pulls in httpx/pydantic) until a caller
+    # actually asks for them; keeps `--help` and dummy runs fast.
+    if name == "DummyBackend":
+        from .dummy import DummyBackend
+
+        return DummyBackend
+    if name == "OpenAIBackend":
+        from .openai_backend import OpenAIBackend
+
+        return OpenAIBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
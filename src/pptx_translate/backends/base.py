@@ -11,6 +11,11 @@ class TranslationBackend(ABC):
     Interface for translation backends.
     """
 
+    #: True when the backend fans requests out itself (honouring
+    #: max_concurrent_requests internally); the translator then sends it one
+    #: call instead of sharding units across threads.
+    manages_concurrency: bool = False
+
     @abstractmethod
     def translate(
         self,
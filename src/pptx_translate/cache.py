@@ -0,0 +1,162 @@
+"""
+Persistent on-disk translation cache.
+
+Maps a content-addressed key (backend, languages, context, source text) to a
+translated string so repeated runs over the same deck skip backend calls.
+CachingBackend layers the cache in front of any TranslationBackend.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pptx_translate.backends.base import TranslationBackend
+from pptx_translate.models import TranslatableUnit
+
+# SQLite limits host parameters per statement; stay under the default 999.
+_IN_CHUNK = 900
+
+
+class TranslationCache:
+    """
+    SQLite-backed key/value store for translations.
+
+    Uses WAL journaling so concurrent readers don't block the writer; keys
+    are opaque digests produced by `make_key`.
+    """
+
+    def __init__(self, path: Path, ttl_days: Optional[float] = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key BLOB PRIMARY KEY, value TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+        if ttl_days is not None:
+            cutoff = int(time.time() - ttl_days * 86400)
+            self._conn.execute("DELETE FROM translations WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> bytes:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.digest()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        keys = list(keys)
+        found: Dict[bytes, str] = {}
+        for start in range(0, len(keys), _IN_CHUNK):
+            chunk = keys[start : start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM translations WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, value in rows:
+                found[bytes(key)] = value
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, str]]) -> None:
+        now = int(time.time())
+        rows: List[Tuple[bytes, str, int]] = [(key, value, now) for key, value in items]
+        if not rows:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, value, created_at) VALUES (?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class CachingBackend(TranslationBackend):
+    """
+    Wraps any translation backend with the persistent cache: cached strings
+    are answered locally, only misses reach the inner backend, and fresh
+    results are written back in one transaction.
+    """
+
+    def __init__(self, backend: TranslationBackend, cache: TranslationCache) -> None:
+        self.backend = backend
+        self.cache = cache
+        self.manages_concurrency = backend.manages_concurrency
+        # Model-aware backends cache per model; others per class.
+        self._backend_id = getattr(backend, "model", None) or backend.__class__.__name__
+        self.logger = logging.getLogger(__name__)
+
+    def translate(
+        self,
+        units: Iterable[TranslatableUnit],
+        source_lang: Optional[str],
+        target_lang: str,
+        max_batch_chars: int = 4000,
+        glossary: Optional[Sequence[dict]] = None,
+        context: Optional[str] = None,
+        max_concurrent_requests: int = 1,
+    ) -> List[TranslatableUnit]:
+        units = list(units)
+        # The glossary steers terminology, so its content belongs in the key:
+        # editing a term must invalidate cached strings, not replay old ones.
+        prompt_hash = hashlib.sha256(
+            (context or "").encode("utf-8")
+            + b"\x00"
+            + json.dumps(glossary or [], sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        keys = {
+            unit.source_text: TranslationCache.make_key(
+                self._backend_id, target_lang, source_lang or "", prompt_hash, unit.source_text
+            )
+            for unit in units
+        }
+        hits = self.cache.get_many(keys.values())
+        by_text: Dict[str, str] = {text: hits[key] for text, key in keys.items() if key in hits}
+        if by_text:
+            self.logger.info("Translation cache: %d/%d unique strings hit", len(by_text), len(keys))
+
+        pending = [unit for unit in units if unit.source_text not in by_text]
+        if pending:
+            translated = self.backend.translate(
+                pending,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                max_batch_chars=max_batch_chars,
+                glossary=glossary,
+                context=context,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+            fresh = {u.source_text: (u.translated_text or u.source_text) for u in translated}
+            by_text.update(fresh)
+            # Backends fall back to the source text for items dropped from a
+            # response; persisting those identity results would pin the miss
+            # forever (no TTL by default). Cache only confirmed translations —
+            # letter-free strings legitimately map to themselves and stay.
+            confirmed = (
+                (keys[text], value)
+                for text, value in fresh.items()
+                if text in keys and (value != text or not any(c.isalpha() for c in text))
+            )
+            self.cache.put_many(confirmed)
+
+        return [
+            TranslatableUnit(
+                id=unit.id,
+                location=unit.location,
+                source_text=unit.source_text,
+                translated_text=by_text.get(unit.source_text, unit.source_text),
+                context=unit.context,
+            )
+            for unit in units
+        ]
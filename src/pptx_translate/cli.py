@@ -2,17 +2,30 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import json
 import logging
+import mmap
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pptx_translate.backends import DummyBackend, OpenAIBackend, TranslationBackend
-from pptx_translate.ocr import OcrBackend, PytesseractOcrBackend
-from pptx_translate.translator import PptxTranslator, generate_run_id, sanitize_output_path
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from pptx_translate.backends.base import TranslationBackend
+from pptx_translate.cache import CachingBackend, TranslationCache
+from pptx_translate.ocr.base import OcrBackend
 
 
 def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="pptx-translate",
         description="Translate PowerPoint .pptx files while preserving layout/formatting.",
@@ -36,6 +49,20 @@ def parse_args() -> argparse.Namespace:
         default=4000,
         help="Maximum characters per translation batch (backend-specific).",
     )
+    parser.add_argument(
+        "--zip-compresslevel",
+        type=int,
+        default=1,
+        choices=range(0, 10),
+        metavar="0-9",
+        help="DEFLATE level for repacked XML parts (default 1; media is stored uncompressed either way).",
+    )
+    parser.add_argument(
+        "--target-model-context",
+        type=int,
+        default=128000,
+        help="Model context window in tokens; caps batch size, reserving 25%% for output.",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -80,6 +107,38 @@ def parse_args() -> argparse.Namespace:
         default=1,
         help="Maximum concurrent translation requests (for backends that support it).",
     )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=Path.home() / ".cache" / "pptx_translate" / "cache.sqlite",
+        help="Path to the persistent translation cache (SQLite).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the persistent translation cache.",
+    )
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        help="Expire cached translations older than this many days.",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        help="Proactive requests-per-minute limit for the translation backend (avoids 429 backoff).",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        help="Proactive tokens-per-minute limit for the translation backend.",
+    )
+    parser.add_argument(
+        "--target-batch-seconds",
+        type=float,
+        default=10.0,
+        help="Target wall time per translation batch; batch size adapts toward it.",
+    )
     parser.add_argument(
         "--translate-images",
         action="store_true",
@@ -124,76 +183,203 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Write derived deck context/profile to this file (optional).",
     )
-    return parser.parse_args()
+    return parser
+
+
+def load_backend(
+    name: str,
+    config_path: Optional[Path] = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    cache: Optional[TranslationCache] = None,
+    target_batch_seconds: Optional[float] = None,
+) -> TranslationBackend:
+    backend = _instantiate_backend(name, config_path, requests_per_minute, tokens_per_minute, target_batch_seconds)
+    if cache is not None:
+        # Caching wraps the backend generically, so dummy and any future
+        # backends benefit the same way the OpenAI one does.
+        return CachingBackend(backend, cache)
+    return backend
 
 
-def load_backend(name: str, config_path: Optional[Path] = None) -> TranslationBackend:
+def _instantiate_backend(
+    name: str,
+    config_path: Optional[Path],
+    requests_per_minute: Optional[int],
+    tokens_per_minute: Optional[int],
+    target_batch_seconds: Optional[float],
+) -> TranslationBackend:
     config = {}
     if config_path:
-        with config_path.open("r", encoding="utf-8") as f:
-            config = json.load(f)
+        # Copy: the cached dict is shared across calls and we setdefault into it.
+        config = dict(_load_config_cached(str(config_path), config_path.stat().st_mtime_ns))
     normalized = name.lower()
     if normalized == "dummy":
+        from pptx_translate.backends.dummy import DummyBackend
+
         return DummyBackend()
     if normalized == "openai":
+        from pptx_translate.backends.openai_backend import OpenAIBackend
+
+        if requests_per_minute is not None:
+            config.setdefault("requests_per_minute", requests_per_minute)
+        if tokens_per_minute is not None:
+            config.setdefault("tokens_per_minute", tokens_per_minute)
+        if target_batch_seconds is not None:
+            config.setdefault("target_batch_seconds", target_batch_seconds)
         return OpenAIBackend(**config)
     raise ValueError(f"Unknown backend: {name}")
 
 
+def _load_json_file(path: Path):
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict:
+    """
+    Memoize backend config parses on (path, mtime) for long-running workers
+    that load the same config for every deck.
+    """
+    return _load_json_file(Path(path_str))
+
+
 def load_ocr_backend(name: str) -> OcrBackend:
     normalized = name.lower()
     if normalized in ("pytesseract", "tesseract"):
+        from pptx_translate.ocr.pytesseract_backend import PytesseractOcrBackend
+
         return PytesseractOcrBackend()
+    if normalized == "tesserocr":
+        from pptx_translate.ocr.tesserocr_backend import TesserocrOcrBackend
+
+        return TesserocrOcrBackend()
     raise ValueError(f"Unknown OCR backend: {name}")
 
 
 def load_glossary(path: Path) -> List[dict]:
     if not path.exists():
         raise FileNotFoundError(f"Glossary file not found: {path}")
+    # Cache by (path, mtime) so batch drivers translating many decks with the
+    # same glossary parse it once per process.
+    return list(_load_glossary_cached(str(path), path.stat().st_mtime))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_glossary_cached(path_str: str, mtime: float) -> Tuple[dict, ...]:
+    path = Path(path_str)
     suffix = path.suffix.lower()
     if suffix == ".csv":
-        entries: List[dict] = []
-        with path.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                src = row.get("source")
-                tgt = row.get("target")
-                if src and tgt:
-                    entries.append({"source": src, "target": tgt})
-        return entries
+        # csv.reader with header indices resolved once avoids the per-row
+        # dict allocation and key hashing DictReader does; newline="" per the
+        # csv module docs.
+        with path.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return ()
+            src_i = header.index("source")
+            tgt_i = header.index("target")
+            min_len = max(src_i, tgt_i) + 1
+            return tuple(
+                {"source": row[src_i], "target": row[tgt_i]}
+                for row in reader
+                if len(row) >= min_len and row[src_i] and row[tgt_i]
+            )
     # default JSON
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json_file(path)
     if isinstance(data, list):
         entries = []
         for item in data:
             if isinstance(item, dict) and "source" in item and "target" in item:
                 entries.append({"source": item["source"], "target": item["target"]})
-        return entries
+        return tuple(entries)
     raise ValueError("Glossary file must be a JSON list of {source,target} or CSV with source,target columns")
 
 
+def _read_context_file(path: Path) -> str:
+    # For big context files, decode straight from an mmap view instead of the
+    # double copy (bytes -> str) that read_text performs.
+    if path.stat().st_size > 64 * 1024:
+        with path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return view[:].decode("utf-8")
+    return path.read_text(encoding="utf-8")
+
+
 def apply_profile_defaults(args: argparse.Namespace) -> None:
     """
     Adjust defaults based on the chosen profile.
     """
     if args.profile == "fast":
-        args.max_batch_chars = max(args.max_batch_chars, 6000)
+        # Large batches convert requests-per-minute pressure into
+        # tokens-per-minute pressure; ~15k tokens/batch at 4 chars/token.
+        args.max_batch_chars = max(args.max_batch_chars, 60000)
         args.max_concurrent_requests = max(args.max_concurrent_requests, 4)
         args.include_masters = False
         args.include_notes = False
     elif args.profile == "quality":
         args.max_batch_chars = min(args.max_batch_chars, 2500)
         args.max_concurrent_requests = 1
+    # Never pack more input than the model context allows, keeping 25% of the
+    # window free for output (4 chars/token estimate).
+    context_cap_chars = (args.target_model_context * 3 // 4) * 4
+    args.max_batch_chars = min(args.max_batch_chars, context_cap_chars)
+
+
+def _print_dry_run_preview(units) -> None:
+    if orjson is None:
+        preview = [
+            {"id": u.id, "location": u.location, "source": u.source_text, "translated": u.translated_text}
+            for u in units
+        ]
+        print(json.dumps(preview, indent=2, ensure_ascii=False))
+        return
+    # orjson's C encoder plus direct buffer writes; chunked framing keeps
+    # peak memory bounded when previewing decks with tens of thousands of
+    # units (each chunk is serialized and released before the next).
+    out = sys.stdout.buffer
+    out.write(b"[")
+    for start in range(0, len(units), 1000):
+        chunk = [
+            {"id": u.id, "location": u.location, "source": u.source_text, "translated": u.translated_text}
+            for u in units[start : start + 1000]
+        ]
+        blob = orjson.dumps(chunk, option=orjson.OPT_INDENT_2)
+        if start:
+            out.write(b",")
+        # Strip the chunk's own array brackets; the outer pair frames the
+        # combined document.
+        out.write(blob[1:-1])
+    out.write(b"]\n")
+    out.flush()
 
 
 def main() -> None:
     args = parse_args()
     logging.basicConfig(level=getattr(logging, args.log_level))
 
+    # Imported here rather than at module top: the translator transitively
+    # loads python-pptx, which --help and argument errors shouldn't pay for.
+    from pptx_translate.translator import PptxTranslator, generate_run_id, sanitize_output_path
+
     apply_profile_defaults(args)
 
-    backend = load_backend(args.backend, args.backend_config)
+    cache: Optional[TranslationCache] = None
+    if not args.no_cache and args.cache_path:
+        cache = TranslationCache(args.cache_path, ttl_days=args.cache_ttl_days)
+
+    backend = load_backend(
+        args.backend,
+        args.backend_config,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        cache=cache,
+        target_batch_seconds=args.target_batch_seconds,
+    )
 
     run_id = args.run_id or generate_run_id()
     output_path = sanitize_output_path(
@@ -207,7 +393,7 @@ def main() -> None:
     glossary = load_glossary(args.glossary) if args.glossary else None
     context = None
     if args.context_file:
-        context = args.context_file.read_text(encoding="utf-8")
+        context = _read_context_file(args.context_file)
     elif args.context:
         context = args.context
 
@@ -217,8 +403,7 @@ def main() -> None:
 
     ocr_config = {}
     if args.image_ocr_config:
-        with args.image_ocr_config.open("r", encoding="utf-8") as f:
-            ocr_config = json.load(f)
+        ocr_config = _load_json_file(args.image_ocr_config)
 
     translator = PptxTranslator(
         backend=backend,
@@ -235,6 +420,7 @@ def main() -> None:
         qa_report_path=args.qa_report,
         qa_report_format=args.qa_report_format,
         qa_threshold_length_ratio=args.qa_threshold_length_ratio,
+        zip_compresslevel=args.zip_compresslevel,
     )
 
     translated_units = translator.translate_file(
@@ -250,11 +436,7 @@ def main() -> None:
     )
 
     if args.dry_run:
-        preview = [
-            {"id": u.id, "location": u.location, "source": u.source_text, "translated": u.translated_text}
-            for u in translated_units
-        ]
-        print(json.dumps(preview, indent=2, ensure_ascii=False))
+        _print_dry_run_preview(translated_units)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslatableUnit:
     """
     Represents a single text node to be translated.
+
+    Slotted because large decks allocate tens of thousands of these; dropping
+    the per-instance __dict__ roughly halves their memory footprint.
     """
 
     id: str
@@ -15,23 +19,32 @@ class TranslatableUnit:
     source_text: str
     translated_text: Optional[str] = None
     context: Optional[str] = None
+    # 128-bit content fingerprint, filled at load time; dedup keys on it so
+    # long repeated strings hash once instead of per dict operation.
+    fingerprint: Optional[bytes] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OcrImageInput:
     """
     Represents an image to be sent to OCR.
+
+    Either image_bytes or image_path is set; a path lets OCR backends hand
+    the file straight to Tesseract without a decode/re-encode round-trip.
+    image_bytes accepts any bytes-like object so producers can pass the raw
+    zip-read buffer (e.g. a memoryview) without an extra copy.
     """
 
     slide_index: int
     shape_index: int
     image_name: str
-    image_bytes: bytes
+    image_bytes: Optional[Union[bytes, bytearray, memoryview]]
     width_px: int
     height_px: int
+    image_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OcrTextRegion:
     """
     OCR result region associated with an image.
@@ -44,3 +57,12 @@ class OcrTextRegion:
     source_text: str
     translated_text: Optional[str] = None
     unit_id: Optional[str] = None
+    # Pixel size of the source image, filled by the translator so overlay
+    # placement can scale bboxes without re-reading the image.
+    image_width_px: Optional[int] = None
+    image_height_px: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Dozens of regions share one image's name; interning collapses them
+        # to a single string object and makes downstream dict keying cheaper.
+        self.image_name = sys.intern(self.image_name)
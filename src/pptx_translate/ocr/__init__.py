@@ -1,4 +1,15 @@
 from pptx_translate.ocr.base import OcrBackend
-from pptx_translate.ocr.pytesseract_backend import PytesseractOcrBackend
 
-__all__ = ["OcrBackend", "PytesseractOcrBackend"]
+__all__ = ["OcrBackend", "PytesseractOcrBackend", "TesserocrOcrBackend"]
+
+
+def __getattr__(name):
+    if name == "PytesseractOcrBackend":
+        from pptx_translate.ocr.pytesseract_backend import PytesseractOcrBackend
+
+        return PytesseractOcrBackend
+    if name == "TesserocrOcrBackend":
+        from pptx_translate.ocr.tesserocr_backend import TesserocrOcrBackend
+
+        return TesserocrOcrBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List, Optional
+from typing import Any, List, Mapping, Optional, Sequence
 
 from pptx_translate.models import OcrImageInput, OcrTextRegion
 
@@ -14,8 +14,8 @@ class OcrBackend(ABC):
     @abstractmethod
     def recognize(
         self,
-        images: Iterable[OcrImageInput],
-        config: Optional[dict] = None,
+        images: Sequence[OcrImageInput],
+        config: Optional[Mapping[str, Any]] = None,
     ) -> List[OcrTextRegion]:
         """
         Perform OCR on images and return text regions.
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import logging
 import io
-from typing import Iterable, List, Optional
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Mapping, Optional, Sequence
 
 from PIL import Image
 
@@ -11,43 +15,201 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     pytesseract = None
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
 from pptx_translate.models import OcrImageInput, OcrTextRegion
 from pptx_translate.ocr.base import OcrBackend
 
 
+def _iter_word_rows(data: dict):
+    """
+    Yield (row_index, text, left, top, width, height) for non-empty words.
+    With numpy the four bbox columns are coerced to int32 arrays once per
+    image instead of four Python-level int() calls per word.
+    """
+    texts = data["text"]
+    if numpy is not None and len(texts) > 32:
+        lefts = numpy.asarray(data["left"], dtype=numpy.int32)
+        tops = numpy.asarray(data["top"], dtype=numpy.int32)
+        widths = numpy.asarray(data["width"], dtype=numpy.int32)
+        heights = numpy.asarray(data["height"], dtype=numpy.int32)
+        mask = numpy.fromiter((bool(t) and not t.isspace() for t in texts), dtype=bool, count=len(texts))
+        for i in numpy.flatnonzero(mask):
+            yield i, texts[i], lefts[i].item(), tops[i].item(), widths[i].item(), heights[i].item()
+        return
+    for i, text in enumerate(texts):
+        # isspace() on a non-empty string avoids allocating the stripped
+        # copy that `text.strip() == ""` built for every kept token.
+        if not text or text.isspace():
+            continue
+        yield i, text, int(data["left"][i]), int(data["top"][i]), int(data["width"][i]), int(data["height"][i])
+
+
+def _picklable_blob(blob):
+    # memoryview/bytearray inputs are fine in-process (BytesIO takes any
+    # bytes-like object) but memoryviews can't cross the pickle boundary to
+    # pool workers; materialize only in that case.
+    if isinstance(blob, memoryview):
+        return blob.tobytes()
+    return blob
+
+
+def _ocr_one(
+    image_bytes: Optional[bytes],
+    image_path: Optional[str],
+    tesseract_config: Optional[str],
+    lang: Optional[str],
+) -> dict:
+    """
+    Worker for the process pool: OCR one image and return the raw data dict.
+    Must stay module-level so it pickles cleanly for child processes.
+    """
+    if image_path is not None:
+        # A filename skips pytesseract's internal Image -> temp PNG round-trip.
+        source = image_path
+    else:
+        source = Image.open(io.BytesIO(image_bytes))
+        if source.mode not in ("L", "1"):
+            # Grayscale is all Tesseract needs for text; 1 byte/pixel instead
+            # of 3-4 shrinks the copy handed to the subprocess.
+            source = source.convert("L")
+    return pytesseract.image_to_data(
+        source,
+        config=tesseract_config,
+        lang=lang,
+        output_type=pytesseract.Output.DICT,
+    )
+
+
+def _ocr_batch(
+    images_bytes: Sequence[tuple],
+    tesseract_config: Optional[str],
+    lang: Optional[str],
+) -> dict:
+    """
+    Worker: OCR a group of images in a single Tesseract invocation via a
+    list file, amortizing process startup and language-data load across the
+    whole group. The returned dict's page_num column routes rows back to
+    images by their position in the group.
+    """
+    with tempfile.TemporaryDirectory(prefix="pptx_translate_ocr_") as tmp:
+        paths = []
+        for i, (blob, existing) in enumerate(images_bytes):
+            if existing is not None:
+                paths.append(existing)
+                continue
+            path = os.path.join(tmp, f"img_{i:04d}.png")
+            pil_image = Image.open(io.BytesIO(blob))
+            if pil_image.mode not in ("L", "1"):
+                pil_image = pil_image.convert("L")
+            pil_image.save(path, format="PNG")
+            paths.append(path)
+        list_path = os.path.join(tmp, "list.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(paths))
+        return pytesseract.image_to_data(
+            list_path,
+            config=tesseract_config,
+            lang=lang,
+            output_type=pytesseract.Output.DICT,
+        )
+
+
 class PytesseractOcrBackend(OcrBackend):
     """
     OCR backend using pytesseract.
+
+    Images are dispatched across a process pool: each pytesseract call is a
+    fresh Tesseract subprocess and OCR is CPU-bound inside it, so running
+    images in parallel scales close to linearly with cores.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         if pytesseract is None:
             raise ImportError("pytesseract is required for OCR; install with `pip install pytesseract pillow` or extras.")
+        self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
 
     def recognize(
         self,
-        images: Iterable[OcrImageInput],
-        config: Optional[dict] = None,
+        images: Sequence[OcrImageInput],
+        config: Optional[Mapping[str, Any]] = None,
     ) -> List[OcrTextRegion]:
-        regions: List[OcrTextRegion] = []
+        images = list(images)
         tesseract_config = config.get("tesseract_config") if config else None
         lang = config.get("lang") if config else None
-        for img in images:
-            pil_image = Image.open(io.BytesIO(img.image_bytes))
-            data = pytesseract.image_to_data(
-                pil_image,
-                config=tesseract_config,
-                lang=lang,
-                output_type=pytesseract.Output.DICT,
-            )
-            for i, text in enumerate(data["text"]):
-                if not text or text.strip() == "":
-                    continue
-                left = int(data["left"][i])
-                top = int(data["top"][i])
-                width = int(data["width"][i])
-                height = int(data["height"][i])
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+
+        if len(images) >= 4:
+            return self._recognize_batched(images, tesseract_config, lang, max_workers)
+
+        if len(images) <= 1 or max_workers == 1:
+            datas = [_ocr_one(img.image_bytes, img.image_path, tesseract_config, lang) for img in images]
+        else:
+            # Cap Tesseract's internal OpenMP threads in the children so
+            # process-level parallelism doesn't oversubscribe the cores.
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(images))) as pool:
+                datas = list(
+                    pool.map(
+                        _ocr_one,
+                        (_picklable_blob(img.image_bytes) for img in images),
+                        (img.image_path for img in images),
+                        (tesseract_config for _ in images),
+                        (lang for _ in images),
+                    )
+                )
+
+        regions: List[OcrTextRegion] = []
+        for img, data in zip(images, datas):
+            self._append_regions(regions, img, data)
+        return regions
+
+    def _recognize_batched(
+        self,
+        images: List[OcrImageInput],
+        tesseract_config: Optional[str],
+        lang: Optional[str],
+        max_workers: int,
+    ) -> List[OcrTextRegion]:
+        """
+        Split images into contiguous groups, one single-invocation list-file
+        OCR per group; groups run in parallel across the pool.
+        """
+        group_count = min(max_workers, max(1, len(images) // 4))
+        size, extra = divmod(len(images), group_count)
+        groups: List[List[OcrImageInput]] = []
+        start = 0
+        for g in range(group_count):
+            end = start + size + (1 if g < extra else 0)
+            groups.append(images[start:end])
+            start = end
+
+        if group_count == 1:
+            datas = [_ocr_batch([(img.image_bytes, img.image_path) for img in groups[0]], tesseract_config, lang)]  # in-process: no pickling
+        else:
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            with ProcessPoolExecutor(max_workers=group_count) as pool:
+                datas = list(
+                    pool.map(
+                        _ocr_batch,
+                        ([(_picklable_blob(img.image_bytes), img.image_path) for img in group] for group in groups),
+                        (tesseract_config for _ in groups),
+                        (lang for _ in groups),
+                    )
+                )
+
+        regions: List[OcrTextRegion] = []
+        for group, data in zip(groups, datas):
+            pages = data["page_num"]
+            for i, text, left, top, width, height in _iter_word_rows(data):
+                # Pages appear in list-file order, so page_num - 1 indexes
+                # the originating image within this group.
+                img = group[int(pages[i]) - 1]
                 regions.append(
                     OcrTextRegion(
                         slide_index=img.slide_index,
@@ -58,3 +220,20 @@ class PytesseractOcrBackend(OcrBackend):
                     )
                 )
         return regions
+
+    @staticmethod
+    def _append_regions(regions: List[OcrTextRegion], img: OcrImageInput, data: dict) -> None:
+        # Build per-image then extend once; cheaper than growing the shared
+        # list a region at a time across thousands of words.
+        name = sys.intern(img.image_name)
+        local = [
+            OcrTextRegion(
+                slide_index=img.slide_index,
+                shape_index=img.shape_index,
+                image_name=name,
+                bbox=(left, top, width, height),
+                source_text=text,
+            )
+            for _, text, left, top, width, height in _iter_word_rows(data)
+        ]
+        regions.extend(local)
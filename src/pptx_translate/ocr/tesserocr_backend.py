@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+import io
+from typing import Any, List, Mapping, Optional, Sequence
+
+from PIL import Image
+
+try:
+    from tesserocr import PSM, RIL, PyTessBaseAPI
+except ImportError:  # pragma: no cover - optional dependency
+    PyTessBaseAPI = None
+
+from pptx_translate.models import OcrImageInput, OcrTextRegion
+from pptx_translate.ocr.base import OcrBackend
+
+
+class TesserocrOcrBackend(OcrBackend):
+    """
+    OCR backend using the tesserocr in-process C++ binding.
+
+    Keeps one PyTessBaseAPI alive for the backend's lifetime, so each image
+    only pays SetImage + Recognize instead of the per-call process startup
+    and language-data load of the pytesseract subprocess path.
+    """
+
+    def __init__(self, lang: Optional[str] = None) -> None:
+        if PyTessBaseAPI is None:
+            raise ImportError("tesserocr is required for this OCR backend; install with `pip install tesserocr`.")
+        self._lang = lang or "eng"
+        self._api = PyTessBaseAPI(lang=self._lang, psm=PSM.AUTO)
+        self.logger = logging.getLogger(__name__)
+
+    def recognize(
+        self,
+        images: Sequence[OcrImageInput],
+        config: Optional[Mapping[str, Any]] = None,
+    ) -> List[OcrTextRegion]:
+        # Honor config["lang"] like the pytesseract backend; a language
+        # switch re-inits the long-lived API once, not per image.
+        lang = config.get("lang") if config else None
+        if lang and lang != self._lang:
+            self._api.Init(lang=lang)
+            self._api.SetPageSegMode(PSM.AUTO)
+            self._lang = lang
+        regions: List[OcrTextRegion] = []
+        for img in images:
+            pil_image = Image.open(io.BytesIO(img.image_bytes))
+            self._api.SetImage(pil_image)
+            self._api.Recognize()
+            iterator = self._api.GetIterator()
+            if iterator is None:
+                continue
+            # Walk word-level results, mirroring the left/top/width/height
+            # TSV columns the pytesseract backend reads.
+            while True:
+                text = iterator.GetUTF8Text(RIL.WORD)
+                if text and text.strip():
+                    x1, y1, x2, y2 = iterator.BoundingBox(RIL.WORD)
+                    regions.append(
+                        OcrTextRegion(
+                            slide_index=img.slide_index,
+                            shape_index=img.shape_index,
+                            image_name=img.image_name,
+                            bbox=(x1, y1, x2 - x1, y2 - y1),
+                            source_text=text.strip(),
+                        )
+                    )
+                if not iterator.Next(RIL.WORD):
+                    break
+        return regions
+
+    def close(self) -> None:
+        self._api.End()
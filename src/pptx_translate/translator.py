@@ -1,20 +1,46 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import io
 import json
 import logging
 import os
+import posixpath
+import re
 import secrets
+import struct
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Dict, Iterable, List, Optional, Tuple
-from xml.etree import ElementTree as ET
+
+try:
+    # lxml's C parser/serializer is several times faster on slide-sized XML;
+    # the subset of the ElementTree API used here is identical.
+    from lxml import etree as ET
+
+    _HAVE_LXML = True
+except ImportError:  # pragma: no cover - optional dependency
+    from xml.etree import ElementTree as ET
+
+    _HAVE_LXML = False
+
+try:
+    # Optional Rust accelerator (built from native/); walks the raw part
+    # bytes with quick-xml and returns (text, fingerprint, node_index) for
+    # every translatable a:t in one GIL-free pass. The ElementTree parse
+    # still happens — injection needs the mutable tree — so the extension
+    # only replaces the per-node filter/fingerprint loop below.
+    from pptx_translate import _native
+except ImportError:  # pragma: no cover - optional extension
+    _native = None
 
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.util import Emu
 
 from pptx_translate.backends import TranslationBackend
 from pptx_translate.models import (
@@ -29,18 +55,139 @@ NAMESPACES = {
     "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
     "cp": "http://schemas.openxmlformats.org/officeDocument/2006/custom-properties",
     "vt": "http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
 }
 
+_A_T_TAG = "{%s}t" % NAMESPACES["a"]
 
-@dataclass
+# Text with no letters at all — whitespace padding runs, bare numbers,
+# punctuation — reads the same in every language; skipping it keeps those
+# strings out of translation batches entirely.
+_UNTRANSLATABLE_RE = re.compile(r"^[\W\d_]+$")
+_CP_PROPERTY_TAG = "{%s}property" % NAMESPACES["cp"]
+_VT_LPWSTR_TAG = "{%s}lpwstr" % NAMESPACES["vt"]
+
+
+def _part_pool_size(count: int) -> int:
+    """
+    Pool size for per-part XML work. The C parser and serializer release the
+    GIL, so threads scale to core count; the +4 keeps slots busy while other
+    threads sit in zip I/O.
+    """
+    return min(32, (os.cpu_count() or 4) + 4, count)
+
+# Media formats that are already compressed; DEFLATE gains ~0% on them and
+# just burns CPU, so they are stored as-is (Office does the same).
+_STORED_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp4", ".m4v", ".mov", ".woff", ".woff2")
+
+# spTree children python-pptx counts as shapes, in document order; indexing
+# these matches the shape_index recorded against OCR regions.
+_SHAPE_TAGS = frozenset(
+    "{%s}%s" % (NAMESPACES["p"], local)
+    for local in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+)
+
+# Clark-notation find() paths, precomputed so per-region lookups skip the
+# namespace-map XPath compilation that "p:spPr/a:xfrm/..." strings pay.
+_SPTREE_PATH = "{%(p)s}cSld/{%(p)s}spTree" % NAMESPACES
+_PIC_OFF_PATH = "{%(p)s}spPr/{%(a)s}xfrm/{%(a)s}off" % NAMESPACES
+_PIC_EXT_PATH = "{%(p)s}spPr/{%(a)s}xfrm/{%(a)s}ext" % NAMESPACES
+_SP_CNVPR_PATH = "{%(p)s}nvSpPr/{%(p)s}cNvPr" % NAMESPACES
+_SP_TEXT_PATH = "{%(p)s}txBody/{%(a)s}p/{%(a)s}r/{%(a)s}t" % NAMESPACES
+
+_OVERLAY_SP_TEMPLATE = (
+    '<p:sp xmlns:a="%(a)s" xmlns:p="%(p)s">'
+    '<p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="square"/><a:lstStyle/><a:p><a:r><a:t/></a:r></a:p></p:txBody>'
+    "</p:sp>"
+) % NAMESPACES
+
+
+def _image_dimensions(blob) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from a PNG/JPEG/GIF header without decoding pixels.
+    Returns None for anything unrecognized; callers fall back to python-pptx,
+    which builds a PIL image behind the scenes.
+    """
+    header = bytes(blob[:32])
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", header[16:24])
+        return width, height
+    if header.startswith(b"GIF87a") or header.startswith(b"GIF89a"):
+        width, height = struct.unpack("<HH", header[6:10])
+        return width, height
+    if header.startswith(b"\xff\xd8"):
+        # Scan JPEG segments for a start-of-frame marker carrying dimensions.
+        data = bytes(blob)
+        pos = 2
+        end = len(data)
+        while pos + 9 < end:
+            if data[pos] != 0xFF:
+                return None
+            marker = data[pos + 1]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[pos + 5 : pos + 9])
+                return width, height
+            pos += 2 + struct.unpack(">H", data[pos + 2 : pos + 4])[0]
+    return None
+
+
+def _unit_fingerprint(unit: TranslatableUnit) -> bytes:
+    """
+    The unit's content fingerprint, computing it for units (backend results,
+    OCR text) that weren't born in the part loader.
+    """
+    return unit.fingerprint or hashlib.blake2b(unit.source_text.encode("utf-8"), digest_size=16).digest()
+
+
+def _parse_text_nodes(source) -> Tuple["ET.ElementTree", List["ET.Element"]]:
+    """
+    Parse one XML part and return its tree plus every a:t element in
+    document order. With lxml, iterparse filtered to the a:t tag yields only
+    the nodes we mutate instead of a Python-level walk of the whole tree.
+    """
+    if _HAVE_LXML:
+        context = ET.iterparse(source, events=("end",), tag=_A_T_TAG, huge_tree=True)
+        elems = [elem for _, elem in context]
+        return ET.ElementTree(context.root), elems
+    # Single pass for the stdlib too: collect a:t elements as their end
+    # events fire instead of walking the finished tree a second time.
+    nodes: List["ET.Element"] = []
+    context = ET.iterparse(source, events=("end",))
+    for _, elem in context:
+        if elem.tag == _A_T_TAG:
+            nodes.append(elem)
+    return ET.ElementTree(context.root), nodes
+
+
+def _serialize_part(root) -> bytes:
+    """
+    Serialize one part the way PowerPoint wrote it: UTF-8 declaration with
+    standalone="yes". Only lxml can emit the standalone attribute; the
+    stdlib fallback omits it, which PowerPoint tolerates.
+    """
+    if _HAVE_LXML:
+        return ET.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+    return ET.tostring(root, xml_declaration=True, encoding="UTF-8")
+
+
+@dataclass(slots=True)
 class DocumentPart:
     """
-    Holds a parsed XML part and its translatable text nodes.
+    Holds a parsed XML part and its translatable text nodes as parallel
+    arrays: elements[i] is the a:t node that units[i] was read from. Keeping
+    the two apart lets unit-only passes iterate without touching Element
+    pointers at all.
     """
 
     path: Path
     tree: ET.ElementTree
-    nodes: List[Tuple[ET.Element, TranslatableUnit]]
+    elements: List[ET.Element]
+    units: List[TranslatableUnit]
 
 
 @dataclass
@@ -89,6 +236,7 @@ class PptxTranslator:
         qa_report_path: Optional[Path] = None,
         qa_report_format: str = "json",
         qa_threshold_length_ratio: float = 1.6,
+        zip_compresslevel: int = 1,
     ) -> None:
         self.backend = backend
         self.include_notes = include_notes
@@ -104,6 +252,7 @@ class PptxTranslator:
         self.qa_report_path = qa_report_path
         self.qa_report_format = qa_report_format
         self.qa_threshold_length_ratio = qa_threshold_length_ratio
+        self.zip_compresslevel = zip_compresslevel
         self.logger = logging.getLogger(__name__)
         self._id_counter = 0
 
@@ -128,66 +277,141 @@ class PptxTranslator:
         self._validate_input(input_path)
         run_id = run_id or generate_run_id()
 
-        deck_profile = self._build_deck_profile(input_path)
+        # One Presentation load serves both the deck profile and OCR image
+        # extraction; each used to re-parse the whole package on its own.
+        try:
+            prs = Presentation(input_path)
+        except Exception:
+            prs = None
+        deck_profile = self._build_deck_profile(prs)
         if deck_profile_path:
             deck_profile_path.write_text(deck_profile.to_context_string(), encoding="utf-8")
 
         combined_context = self._combine_context(context, deck_profile)
 
-        with TemporaryDirectory() as tmp_dir:
-            temp_root = Path(tmp_dir)
-            self._unpack_pptx(input_path, temp_root)
-            parts = self._load_parts(temp_root)
-            text_units = [unit for part in parts for _, unit in part.nodes]
-
-            if generate_glossary_path:
-                self._generate_glossary(generate_glossary_path, text_units, deck_profile)
-                self.logger.info("Generated glossary at %s", generate_glossary_path)
-                return []
-
-            ocr_units: List[TranslatableUnit] = []
-            ocr_regions: List[OcrTextRegion] = []
-            if self.translate_images:
-                ocr_units, ocr_regions = self._extract_image_units(input_path)
-                self.logger.info("Extracted %d OCR text regions from images", len(ocr_units))
-
-            all_units = text_units + ocr_units
-            if not all_units:
-                self.logger.info("No translatable content found")
-                return []
-
-            translated_units = self._translate_units(
-                all_units,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                glossary=glossary,
-                context=combined_context,
-            )
-            translated_map: Dict[str, TranslatableUnit] = {u.id: u for u in translated_units}
-
-            if not self.dry_run:
-                self._inject_translations(parts, translated_map)
-                self._repack_pptx(temp_root, output_path)
-                if self.translate_images and ocr_regions:
-                    self._apply_image_overlays(output_path, ocr_regions, translated_map)
-                self._embed_run_metadata(
-                    output_path,
-                    {
-                        "run_id": run_id,
-                        "source_lang": source_lang or "auto",
-                        "target_lang": target_lang,
-                        "backend": self.backend.__class__.__name__,
-                        "profile": self.profile,
-                        "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                    },
+        # Parse the XML parts straight out of the zip and write the output
+        # zip member-by-member: embedded media is never extracted to disk or
+        # re-compressed from scratch, and only parts that actually changed
+        # are re-serialized.
+        with zipfile.ZipFile(input_path, "r") as zf:
+            parts = self._load_parts_from_zip(zf)
+        result = self._collect_and_translate(
+            parts, prs, source_lang, target_lang, glossary, combined_context,
+            generate_glossary_path, deck_profile,
+        )
+        if result is None:
+            return []
+        translated_units, translated_map, ocr_regions = result
+        if not translated_units:
+            return translated_units
+        if not self.dry_run:
+            self._apply_translations_to_nodes(parts, translated_map)
+            if self.translate_images and ocr_regions:
+                self._apply_overlays_to_parts(
+                    parts, ocr_regions, translated_map, self._slide_part_order(input_path)
                 )
-                self.logger.info("Wrote translated file to %s (run_id=%s)", output_path, run_id)
-                if self.qa_report_path:
-                    self._generate_qa_report(output_path, translated_units, run_id)
-            else:
-                self.logger.info("Dry run mode: no output file written")
+            self._repack_streaming(
+                input_path, output_path, parts, self._run_metadata(run_id, source_lang, target_lang)
+            )
+            self._finalize_output(output_path, translated_units, run_id)
+        else:
+            self.logger.info("Dry run mode: no output file written")
+        return translated_units
 
-            return translated_units
+    def _collect_and_translate(
+        self,
+        parts: List[DocumentPart],
+        prs: Optional["Presentation"],
+        source_lang: str | None,
+        target_lang: str,
+        glossary: list[dict] | None,
+        combined_context: str,
+        generate_glossary_path: Optional[Path],
+        deck_profile: DeckProfile,
+    ) -> Optional[Tuple[List[TranslatableUnit], Dict[str, TranslatableUnit], List[OcrTextRegion]]]:
+        """
+        Shared middle of the pipeline: gather text and OCR units, translate.
+        Returns None when only a glossary was requested.
+        """
+        text_units = [unit for part in parts for unit in part.units]
+
+        if generate_glossary_path:
+            self._generate_glossary(generate_glossary_path, text_units, deck_profile)
+            self.logger.info("Generated glossary at %s", generate_glossary_path)
+            return None
+
+        ocr_units: List[TranslatableUnit] = []
+        ocr_regions: List[OcrTextRegion] = []
+        if self.translate_images:
+            ocr_units, ocr_regions = self._extract_image_units(prs)
+            self.logger.info("Extracted %d OCR text regions from images", len(ocr_units))
+
+        all_units = text_units + ocr_units
+        if not all_units:
+            self.logger.info("No translatable content found")
+            return [], {}, []
+
+        translated_units = self._translate_units(
+            all_units,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            glossary=glossary,
+            context=combined_context,
+        )
+        translated_map: Dict[str, TranslatableUnit] = {u.id: u for u in translated_units}
+        return translated_units, translated_map, ocr_regions
+
+    def _run_metadata(self, run_id: str, source_lang: str | None, target_lang: str) -> Dict[str, str]:
+        return {
+            "run_id": run_id,
+            "source_lang": source_lang or "auto",
+            "target_lang": target_lang,
+            "backend": self.backend.__class__.__name__,
+            "profile": self.profile,
+            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _finalize_output(
+        self,
+        output_path: Path,
+        translated_units: List[TranslatableUnit],
+        run_id: str,
+    ) -> None:
+        self.logger.info("Wrote translated file to %s (run_id=%s)", output_path, run_id)
+        if self.qa_report_path:
+            self._generate_qa_report(output_path, translated_units, run_id)
+
+    async def translate_file_async(
+        self,
+        input_path: Path,
+        output_path: Path,
+        source_lang: str | None,
+        target_lang: str,
+        glossary: list[dict] | None = None,
+        context: str | None = None,
+        run_id: Optional[str] = None,
+        generate_glossary_path: Optional[Path] = None,
+        deck_profile_path: Optional[Path] = None,
+    ) -> List[TranslatableUnit]:
+        """
+        Awaitable wrapper around translate_file for async drivers (GUI
+        wrappers, batch servers). Runs the pipeline in a worker thread so it
+        never blocks the caller's event loop; request-level concurrency is
+        handled inside the backend via max_concurrent_requests, which fans
+        batches out with asyncio.gather on its own loop.
+        """
+        return await asyncio.to_thread(
+            self.translate_file,
+            input_path=input_path,
+            output_path=output_path,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            glossary=glossary,
+            context=context,
+            run_id=run_id,
+            generate_glossary_path=generate_glossary_path,
+            deck_profile_path=deck_profile_path,
+        )
 
     def _validate_input(self, input_path: Path) -> None:
         if not input_path.exists():
@@ -195,37 +419,153 @@ class PptxTranslator:
         if input_path.suffix.lower() != ".pptx":
             raise ValueError("Input file must be a .pptx")
 
-    def _unpack_pptx(self, input_path: Path, temp_root: Path) -> None:
-        with zipfile.ZipFile(input_path, "r") as zf:
-            zf.extractall(temp_root)
-        self.logger.debug("Extracted pptx to %s", temp_root)
-
-    def _load_parts(self, temp_root: Path) -> List[DocumentPart]:
-        paths = self._discover_xml_parts(temp_root)
+    def _load_parts_from_zip(self, zf: zipfile.ZipFile) -> List[DocumentPart]:
+        arcnames = self._candidate_arcnames(zf.namelist())
         parts: List[DocumentPart] = []
 
-        for path in paths:
-            tree = ET.parse(path)
-            root = tree.getroot()
-            nodes: List[Tuple[ET.Element, TranslatableUnit]] = []
-            for idx, elem in enumerate(root.findall(".//a:t", namespaces=NAMESPACES)):
-                text = elem.text if elem.text is not None else ""
-                if text == "":
-                    continue
-                unit_id = self._next_id()
-                location = f"{path.relative_to(temp_root)}::a:t[{idx}]"
-                unit = TranslatableUnit(
-                    id=unit_id,
-                    location=str(location),
-                    source_text=text,
-                    context=None,
-                )
-                nodes.append((elem, unit))
-            parts.append(DocumentPart(path=path, tree=tree, nodes=nodes))
+        # Read member bytes off the single handle, then parse in parallel —
+        # the C parsers release the GIL — and assign unit ids in a sequential
+        # pass so ids and locations stay deterministic.
+        payloads = [zf.read(arcname) for arcname in arcnames]
+        if len(arcnames) > 1:
+            with ThreadPoolExecutor(max_workers=_part_pool_size(len(arcnames))) as pool:
+                parsed = list(pool.map(lambda data: _parse_text_nodes(io.BytesIO(data)), payloads))
+        else:
+            parsed = [_parse_text_nodes(io.BytesIO(data)) for data in payloads]
+
+        for arcname, payload, (tree, elems) in zip(arcnames, payloads, parsed):
+            elements: List[ET.Element] = []
+            units: List[TranslatableUnit] = []
+            # One shared prefix per part instead of re-formatting the full
+            # arcname into every location string.
+            location_prefix = arcname + "::a:t["
+            if _native is not None:
+                # The Rust pass applies the same letter-free filter and
+                # blake2b-128 fingerprint; node_index counts all a:t nodes
+                # in document order, matching enumerate(elems) below.
+                for text, fingerprint, idx in _native.parse_slide_xml(payload):
+                    elements.append(elems[idx])
+                    units.append(
+                        TranslatableUnit(
+                            id=self._next_id(),
+                            location=f"{location_prefix}{idx}]",
+                            source_text=text,
+                            context=None,
+                            fingerprint=fingerprint,
+                        )
+                    )
+            else:
+                for idx, elem in enumerate(elems):
+                    text = elem.text if elem.text is not None else ""
+                    if text == "" or _UNTRANSLATABLE_RE.match(text):
+                        continue
+                    elements.append(elem)
+                    units.append(
+                        TranslatableUnit(
+                            id=self._next_id(),
+                            location=f"{location_prefix}{idx}]",
+                            source_text=text,
+                            context=None,
+                            fingerprint=hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+                        )
+                    )
+            # path doubles as the archive name.
+            parts.append(DocumentPart(path=Path(arcname), tree=tree, elements=elements, units=units))
 
         return parts
 
-    def _translate_units(
+    def _candidate_arcnames(self, namelist: List[str]) -> List[str]:
+        """
+        Select the translatable XML parts from a zip namelist.
+        """
+        prefixes = ["ppt/slides/slide"]
+        if self.include_notes:
+            prefixes.append("ppt/notesSlides/notesSlide")
+        if self.include_masters:
+            prefixes.append("ppt/slideMasters/slideMaster")
+            prefixes.append("ppt/slideLayouts/slideLayout")
+        selected: List[str] = []
+        for prefix in prefixes:
+            selected.extend(
+                sorted(name for name in namelist if name.startswith(prefix) and name.endswith(".xml"))
+            )
+        return selected
+
+    def _repack_streaming(
+        self,
+        input_path: Path,
+        output_path: Path,
+        parts: List[DocumentPart],
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Copy the input zip member-by-member, substituting the re-serialized
+        XML for translated parts and the updated custom properties; untouched
+        members (media and the rest) are transferred without ever living on
+        disk uncompressed. Iterating infolist() keeps the original entry
+        order — [Content_Types].xml stays first, which some PPTX consumers
+        rely on.
+        """
+        custom_arc = "docProps/custom.xml"
+        # as_posix(), not str(): zip member names always use forward slashes,
+        # and str(Path) would produce backslashes on Windows, so the lookup
+        # against info.filename below would silently never match.
+        translated_parts = {part.path.as_posix(): part for part in parts}
+        # Serialize the translated parts up front across threads; lxml's
+        # serializer releases the GIL, and the write loop below then only
+        # compresses and copies.
+        if len(translated_parts) > 1:
+            with ThreadPoolExecutor(max_workers=_part_pool_size(len(translated_parts))) as pool:
+                serialized = dict(
+                    zip(
+                        translated_parts,
+                        pool.map(lambda part: _serialize_part(part.tree.getroot()), translated_parts.values()),
+                    )
+                )
+        else:
+            serialized = {arc: _serialize_part(part.tree.getroot()) for arc, part in translated_parts.items()}
+        # Build next to the destination and rename into place: the temp file
+        # shares the output's filesystem (no cross-device copy at the end)
+        # and an interrupted run never leaves a half-written .pptx behind.
+        partial_path = output_path.with_name(output_path.name + ".partial")
+        try:
+            self._write_output_zip(input_path, partial_path, serialized, metadata, custom_arc)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        os.replace(partial_path, output_path)
+
+    def _write_output_zip(
+        self,
+        input_path: Path,
+        output_path: Path,
+        serialized: Dict[str, bytes],
+        metadata: Optional[Dict[str, str]],
+        custom_arc: str,
+    ) -> None:
+        with zipfile.ZipFile(input_path, "r") as src, zipfile.ZipFile(
+            output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=self.zip_compresslevel
+        ) as dst:
+            metadata_written = False
+            for info in src.infolist():
+                payload = serialized.get(info.filename)
+                if payload is None:
+                    if metadata is not None and info.filename == custom_arc:
+                        payload = self._custom_properties_payload(src.read(info.filename), metadata)
+                        metadata_written = True
+                    else:
+                        payload = src.read(info.filename)
+                        if info.compress_type != zipfile.ZIP_STORED and info.filename.lower().endswith(
+                            _STORED_SUFFIXES
+                        ):
+                            # Already-compressed media gains nothing from
+                            # another DEFLATE pass; store it and skip the CPU.
+                            info.compress_type = zipfile.ZIP_STORED
+                dst.writestr(info, payload)
+            if metadata is not None and not metadata_written:
+                dst.writestr(custom_arc, self._custom_properties_payload(None, metadata))
+
+    def _dispatch_translate(
         self,
         units: List[TranslatableUnit],
         source_lang: str | None,
@@ -233,7 +573,14 @@ class PptxTranslator:
         glossary: list[dict] | None,
         context: str | None,
     ) -> List[TranslatableUnit]:
-        if not self.dedupe_text:
+        """
+        Hand units to the backend, sharding across threads when the backend
+        does not pipeline requests itself. Backends with their own async
+        fan-out (manages_concurrency) get one call so their rate limiting
+        stays in charge.
+        """
+        workers = self.max_concurrent_requests
+        if workers <= 1 or self.backend.manages_concurrency or len(units) <= 1:
             return self.backend.translate(
                 units,
                 source_lang=source_lang,
@@ -241,111 +588,154 @@ class PptxTranslator:
                 max_batch_chars=self.max_batch_chars,
                 glossary=glossary,
                 context=context,
-                max_concurrent_requests=self.max_concurrent_requests,
+                max_concurrent_requests=workers,
             )
 
-        text_to_units: Dict[str, List[TranslatableUnit]] = {}
+        # Pack length-sorted units into char-bounded batches: sorting keeps
+        # each batch homogeneous, so a run of short labels is never stuck
+        # behind one paragraph-sized string in the same request.
+        order = sorted(range(len(units)), key=lambda i: len(units[i].source_text))
+        batches: List[List[TranslatableUnit]] = []
+        current: List[TranslatableUnit] = []
+        size = 0
+        for i in order:
+            unit = units[i]
+            length = len(unit.source_text)
+            if current and size + length > self.max_batch_chars:
+                batches.append(current)
+                current = []
+                size = 0
+            current.append(unit)
+            size += length
+        if current:
+            batches.append(current)
+
+        def translate_one(batch: List[TranslatableUnit]) -> List[TranslatableUnit]:
+            return self.backend.translate(
+                batch,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                max_batch_chars=self.max_batch_chars,
+                glossary=glossary,
+                context=context,
+                max_concurrent_requests=1,
+            )
+
+        if len(batches) == 1:
+            return translate_one(batches[0])
+        sorted_results: List[TranslatableUnit] = []
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+            for batch_result in pool.map(translate_one, batches):
+                sorted_results.extend(batch_result)
+        # Undo the length sort so callers get results aligned with their
+        # input, one per unit.
+        results: List[TranslatableUnit] = [None] * len(units)  # type: ignore[list-item]
+        for pos, i in enumerate(order):
+            results[i] = sorted_results[pos]
+        return results
+
+    def _translate_units(
+        self,
+        units: List[TranslatableUnit],
+        source_lang: str | None,
+        target_lang: str,
+        glossary: list[dict] | None,
+        context: str | None,
+    ) -> List[TranslatableUnit]:
+        if not self.dedupe_text:
+            return self._dispatch_translate(units, source_lang, target_lang, glossary, context)
+
+        # Tiny decks and all-unique decks gain nothing from dedup
+        # bookkeeping; hand them straight to the backend. The duplicate probe
+        # stops at the first repeat, so on boilerplate-heavy decks it exits
+        # almost immediately.
+        if len(units) <= 32:
+            return self._dispatch_translate(units, source_lang, target_lang, glossary, context)
+        probe: set[bytes] = set()
+        add = probe.add
+        for unit in units:
+            before = len(probe)
+            add(_unit_fingerprint(unit))
+            if len(probe) == before:
+                break
+        else:
+            return self._dispatch_translate(units, source_lang, target_lang, glossary, context)
+
+        # Group duplicates while picking the representatives: the dict keys
+        # on the 16-byte fingerprint rather than the full string, so long
+        # repeated body copy is hashed once at load time instead of per dict
+        # operation, and doubles as the broadcast map during fan-out.
+        text_to_units: Dict[bytes, List[TranslatableUnit]] = {}
         unique_units: List[TranslatableUnit] = []
         for unit in units:
-            key = unit.source_text
-            if key not in text_to_units:
+            key = _unit_fingerprint(unit)
+            group = text_to_units.get(key)
+            if group is None:
                 text_to_units[key] = [unit]
                 unique_units.append(unit)
             else:
-                text_to_units[key].append(unit)
+                group.append(unit)
 
         self.logger.info("Deduped %d texts down to %d unique entries", len(units), len(unique_units))
 
-        translated_unique = self.backend.translate(
-            unique_units,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            max_batch_chars=self.max_batch_chars,
-            glossary=glossary,
-            context=context,
-            max_concurrent_requests=self.max_concurrent_requests,
-        )
-        by_text: Dict[str, str] = {u.source_text: (u.translated_text or u.source_text) for u in translated_unique}
+        translated_unique = self._dispatch_translate(unique_units, source_lang, target_lang, glossary, context)
 
-        translated_all: List[TranslatableUnit] = []
+        # Broadcast each unique result to its whole group in place: one hash
+        # per unique text, no by_text dict, no per-duplicate allocations.
+        for tu in translated_unique:
+            translated = tu.translated_text or tu.source_text
+            for orig in text_to_units[_unit_fingerprint(tu)]:
+                orig.translated_text = translated
+        # A backend that drops a string leaves its group untranslated; fall
+        # back to the source so callers always see filled units.
         for unit in units:
-            translated_text = by_text.get(unit.source_text, unit.source_text)
-            translated_all.append(
-                TranslatableUnit(
-                    id=unit.id,
-                    location=unit.location,
-                    source_text=unit.source_text,
-                    translated_text=translated_text,
-                    context=unit.context,
-                )
-            )
-        return translated_all
+            if unit.translated_text is None:
+                unit.translated_text = unit.source_text
+        return units
 
-    def _inject_translations(
+    def _apply_translations_to_nodes(
         self,
         parts: List[DocumentPart],
         translated_map: Dict[str, TranslatableUnit],
     ) -> None:
+        # Hot loop on big decks: bind the map lookup once and keep the
+        # translated text in a local so each element costs one dict probe,
+        # one attribute read, and the C-level text assignment.
+        get = translated_map.get
         for part in parts:
-            for elem, unit in part.nodes:
-                translated = translated_map.get(unit.id)
-                if translated and translated.translated_text is not None:
-                    elem.text = translated.translated_text
-            part.tree.write(part.path, xml_declaration=True, encoding="utf-8", method="xml")
-
-    def _repack_pptx(self, temp_root: Path, output_path: Path) -> None:
-        if output_path.exists():
-            output_path.unlink()
-        with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for folder, _, files in os.walk(temp_root):
-                for filename in files:
-                    abs_path = Path(folder) / filename
-                    arcname = abs_path.relative_to(temp_root)
-                    # Ensure POSIX separators inside the zip
-                    zf.write(abs_path, arcname=str(arcname).replace(os.sep, "/"))
-
-    def _discover_xml_parts(self, temp_root: Path) -> List[Path]:
-        """
-        Collect relevant XML parts that may contain text.
-        """
-        candidates: List[Path] = []
-        slides_dir = temp_root / "ppt" / "slides"
-        notes_dir = temp_root / "ppt" / "notesSlides"
-        masters_dir = temp_root / "ppt" / "slideMasters"
-        layouts_dir = temp_root / "ppt" / "slideLayouts"
-
-        candidates.extend(sorted(slides_dir.glob("slide*.xml")))
-        if self.include_notes:
-            candidates.extend(sorted(notes_dir.glob("notesSlide*.xml")))
-        if self.include_masters:
-            candidates.extend(sorted(masters_dir.glob("slideMaster*.xml")))
-            candidates.extend(sorted(layouts_dir.glob("slideLayout*.xml")))
-
-        existing = [path for path in candidates if path.exists()]
-        return existing
+            for elem, unit in zip(part.elements, part.units):
+                translated = get(unit.id)
+                if translated is not None and (text := translated.translated_text) is not None:
+                    elem.text = text
 
-    def _build_deck_profile(self, pptx_path: Path) -> DeckProfile:
+    def _build_deck_profile(self, prs: Optional["Presentation"]) -> DeckProfile:
         """
-        Build a basic deck profile (titles, sections, keywords).
+        Build a basic deck profile (titles, sections, keywords) from an
+        already-loaded Presentation.
         """
-        try:
-            prs = Presentation(pptx_path)
-        except Exception:
+        if prs is None:
             return DeckProfile(title=None, section_titles=[], keywords=[], summary=None)
 
-        title = None
+        title: Optional[str] = None
         section_titles: List[str] = []
-        texts: List[str] = []
-        for slide in prs.slides:
-            if slide.shapes.title and slide.shapes.title.text:
-                if title is None:
-                    title = slide.shapes.title.text.strip()
-                section_titles.append(slide.shapes.title.text.strip())
-            for shape in slide.shapes:
-                if shape.has_text_frame:
-                    texts.append(shape.text)
-
-        keywords = _extract_top_keywords(texts, top_n=20)
+
+        def iter_texts():
+            # Single pass over the deck: titles are collected as a side
+            # effect while shape text streams straight into the keyword
+            # counter, so no intermediate texts list is materialized.
+            nonlocal title
+            for slide in prs.slides:
+                title_shape = slide.shapes.title
+                if title_shape is not None and title_shape.text:
+                    slide_title = title_shape.text.strip()
+                    if title is None:
+                        title = slide_title
+                    section_titles.append(slide_title)
+                for shape in slide.shapes:
+                    if shape.has_text_frame:
+                        yield shape.text
+
+        keywords = _extract_top_keywords(iter_texts(), top_n=20)
         # Lightweight summary: join first few titles/bullets
         summary = "; ".join(section_titles[:5]) if section_titles else None
         return DeckProfile(title=title, section_titles=section_titles, keywords=keywords, summary=summary)
@@ -372,146 +762,245 @@ class PptxTranslator:
         if deck_profile.keywords:
             self.logger.info("Glossary seeded with %d frequent terms", len(terms))
 
-    def _extract_image_units(self, pptx_path: Path) -> Tuple[List[TranslatableUnit], List[OcrTextRegion]]:
+    def _extract_image_units(self, prs: Optional["Presentation"]) -> Tuple[List[TranslatableUnit], List[OcrTextRegion]]:
+        if prs is None:
+            return [], []
         if not self.ocr_backend:
-            # attempt to instantiate pytesseract by default
+            # attempt to instantiate pytesseract by default; when the caller
+            # set a concurrency limit, bound the backend's worker pool by it
+            # so OCR parallelism respects the same knob as translation.
             try:
-                self.ocr_backend = PytesseractOcrBackend()
+                if self.max_concurrent_requests > 1:
+                    self.ocr_backend = PytesseractOcrBackend(max_workers=self.max_concurrent_requests)
+                else:
+                    self.ocr_backend = PytesseractOcrBackend()
             except Exception as exc:  # pragma: no cover - optional dependency
                 self.logger.warning("OCR backend unavailable: %s", exc)
                 return [], []
 
-        prs = Presentation(pptx_path)
-        image_inputs: List[OcrImageInput] = []
+        # The same logo/screenshot typically appears on many slides; OCR only
+        # one representative per unique image content (blake2b of the blob)
+        # and fan the recognized regions out to every other occurrence.
+        inputs_by_hash: Dict[bytes, OcrImageInput] = {}
+        occurrences: List[Tuple[int, int, bytes]] = []
         for slide_idx, slide in enumerate(prs.slides):
             for shape_idx, shape in enumerate(slide.shapes):
                 if shape.shape_type != MSO_SHAPE_TYPE.PICTURE:
                     continue
                 image = shape.image
-                image_inputs.append(
-                    OcrImageInput(
+                blob = image.blob
+                # Hashing the first 64 KiB plus the length is enough to tell
+                # embedded images apart and stays cheap for multi-MB media.
+                digest = hashlib.blake2b(blob[:65536], digest_size=16)
+                digest.update(len(blob).to_bytes(8, "little"))
+                content_key = digest.digest()
+                occurrences.append((slide_idx, shape_idx, content_key))
+                if content_key not in inputs_by_hash:
+                    # Dimensions come from a ~30-byte header read; image.size
+                    # is only consulted for formats the parser doesn't know.
+                    dims = _image_dimensions(blob) or image.size
+                    inputs_by_hash[content_key] = OcrImageInput(
                         slide_index=slide_idx,
                         shape_index=shape_idx,
                         image_name=image.filename or f"image{slide_idx}_{shape_idx}",
-                        image_bytes=image.blob,
-                        width_px=image.size[0],
-                        height_px=image.size[1],
+                        image_bytes=blob,
+                        width_px=dims[0],
+                        height_px=dims[1],
                     )
-                )
-        if not image_inputs:
+        if not inputs_by_hash:
             return [], []
+        if len(inputs_by_hash) < len(occurrences):
+            self.logger.info(
+                "OCR cache: %d picture shapes share %d unique images", len(occurrences), len(inputs_by_hash)
+            )
 
-        ocr_regions = self.ocr_backend.recognize(image_inputs, config=self.ocr_config)
+        recognized = self.ocr_backend.recognize(list(inputs_by_hash.values()), config=self.ocr_config)
+        regions_by_key: Dict[bytes, List[OcrTextRegion]] = {key: [] for key in inputs_by_hash}
+        key_by_rep = {(inp.slide_index, inp.shape_index): key for key, inp in inputs_by_hash.items()}
+        for region in recognized:
+            key = key_by_rep[(region.slide_index, region.shape_index)]
+            inp = inputs_by_hash[key]
+            region.image_width_px = inp.width_px
+            region.image_height_px = inp.height_px
+            regions_by_key[key].append(region)
+
+        ocr_regions: List[OcrTextRegion] = []
+        for slide_idx, shape_idx, content_key in occurrences:
+            for region in regions_by_key[content_key]:
+                if region.slide_index == slide_idx and region.shape_index == shape_idx:
+                    ocr_regions.append(region)
+                else:
+                    ocr_regions.append(
+                        OcrTextRegion(
+                            slide_index=slide_idx,
+                            shape_index=shape_idx,
+                            image_name=region.image_name,
+                            bbox=region.bbox,
+                            source_text=region.source_text,
+                            image_width_px=region.image_width_px,
+                            image_height_px=region.image_height_px,
+                        )
+                    )
+        # Watermarks and repeated labels ("Confidential") OCR identically on
+        # many slides; regions sharing a source text share one unit so the
+        # backend translates each unique string once.
         ocr_units: List[TranslatableUnit] = []
+        unit_id_by_text: Dict[str, str] = {}
         for region in ocr_regions:
-            unit_id = self._next_id()
-            region.unit_id = unit_id
-            ocr_units.append(
-                TranslatableUnit(
-                    id=unit_id,
-                    location=f"slide{region.slide_index}_img{region.shape_index}_bbox",
-                    source_text=region.source_text,
-                    context="image_text",
+            unit_id = unit_id_by_text.get(region.source_text)
+            if unit_id is None:
+                unit_id = self._next_id()
+                unit_id_by_text[region.source_text] = unit_id
+                ocr_units.append(
+                    TranslatableUnit(
+                        id=unit_id,
+                        location=f"slide{region.slide_index}_img{region.shape_index}_bbox",
+                        source_text=region.source_text,
+                        context="image_text",
+                    )
                 )
-            )
+            region.unit_id = unit_id
             region.translated_text = None  # will be filled after translation
         return ocr_units, ocr_regions
 
-    def _apply_image_overlays(
+    def _slide_part_order(self, input_path: Path) -> List[str]:
+        """
+        Arcnames of the slide parts in presentation order — the order
+        python-pptx exposes via prs.slides and the one OCR regions record
+        their slide_index against — resolved through sldIdLst and the
+        presentation relationships.
+        """
+        with zipfile.ZipFile(input_path, "r") as zf:
+            pres_root = ET.fromstring(zf.read("ppt/presentation.xml"))
+            rels_root = ET.fromstring(zf.read("ppt/_rels/presentation.xml.rels"))
+        targets = {
+            rel.get("Id"): rel.get("Target")
+            for rel in rels_root.iter("{%s}Relationship" % NAMESPACES["rel"])
+        }
+        order: List[str] = []
+        for sld_id in pres_root.iter("{%s}sldId" % NAMESPACES["p"]):
+            target = targets.get(sld_id.get("{%s}id" % NAMESPACES["r"]))
+            if target:
+                order.append(posixpath.normpath(posixpath.join("ppt", target)))
+        return order
+
+    def _apply_overlays_to_parts(
         self,
-        pptx_path: Path,
+        parts: List[DocumentPart],
         regions: List[OcrTextRegion],
         translated_map: Dict[str, TranslatableUnit],
+        slide_arcnames: List[str],
     ) -> None:
-        prs = Presentation(pptx_path)
-        emu = lambda v: Emu(int(v))
+        """
+        Append one overlay text box per OCR region directly to the parsed
+        slide trees, before packing. Building the <p:sp> from a template and
+        editing XML in place replaces the old post-pack Presentation
+        load/mutate/save round-trip, which re-serialized every part in the
+        deck just to add a few shapes.
+        """
+        parts_by_arc: Dict[str, DocumentPart] = {}
+        for part in parts:
+            posix = part.path.as_posix()
+            idx = posix.find("ppt/")
+            if idx != -1:
+                parts_by_arc[posix[idx:]] = part
+
+        pic_tag = "{%s}pic" % NAMESPACES["p"]
+        cnvpr_tag = "{%s}cNvPr" % NAMESPACES["p"]
+        next_ids: Dict[str, int] = {}
         for region in regions:
-            translated = None
-            if region.unit_id and region.unit_id in translated_map:
-                translated = translated_map[region.unit_id].translated_text or translated_map[region.unit_id].source_text
+            entry = translated_map.get(region.unit_id) if region.unit_id else None
+            translated = (entry.translated_text or entry.source_text) if entry else None
             if not translated:
                 translated = region.source_text
-            try:
-                slide = prs.slides[region.slide_index]
-                shape = slide.shapes[region.shape_index]
-            except IndexError:
+            if region.slide_index >= len(slide_arcnames):
                 continue
-            if shape.shape_type != MSO_SHAPE_TYPE.PICTURE:
+            arcname = slide_arcnames[region.slide_index]
+            part = parts_by_arc.get(arcname)
+            if part is None or not region.image_width_px or not region.image_height_px:
                 continue
-            img_width_px, img_height_px = shape.image.size
-            if img_width_px == 0 or img_height_px == 0:
+            root = part.tree.getroot()
+            sp_tree = root.find(_SPTREE_PATH)
+            if sp_tree is None:
                 continue
+            shape_elems = [child for child in sp_tree if child.tag in _SHAPE_TAGS]
+            if region.shape_index >= len(shape_elems):
+                continue
+            pic = shape_elems[region.shape_index]
+            if pic.tag != pic_tag:
+                continue
+            off = pic.find(_PIC_OFF_PATH)
+            ext = pic.find(_PIC_EXT_PATH)
+            if off is None or ext is None:
+                continue
+            shape_w, shape_h = int(ext.get("cx")), int(ext.get("cy"))
             left_px, top_px, w_px, h_px = region.bbox
-            scale_x = shape.width / img_width_px
-            scale_y = shape.height / img_height_px
-            left = shape.left + emu(left_px * scale_x)
-            top = shape.top + emu(top_px * scale_y)
-            width = emu(max(w_px * scale_x, shape.width * 0.25))
-            height = emu(max(h_px * scale_y, shape.height * 0.15))
-
-            textbox = slide.shapes.add_textbox(left, top, width, height)
-            textbox.text_frame.text = translated
-            fill = textbox.fill
-            fill.solid()
-            try:
-                if shape.fill.type and shape.fill.fore_color:
-                    fill.fore_color.rgb = shape.fill.fore_color.rgb
-            except Exception:
-                pass
-            textbox.text_frame.word_wrap = True
-            textbox.name = f"pptx_translate_overlay_{region.image_name}"
-        prs.save(pptx_path)
-
-    def _embed_run_metadata(self, pptx_path: Path, metadata: Dict[str, str]) -> None:
-        with TemporaryDirectory() as tmp_dir:
-            tmp_root = Path(tmp_dir)
-            with zipfile.ZipFile(pptx_path, "r") as zf:
-                zf.extractall(tmp_root)
-            props_path = tmp_root / "docProps" / "custom.xml"
-            props_path.parent.mkdir(parents=True, exist_ok=True)
-            if props_path.exists():
-                tree = ET.parse(props_path)
-                root = tree.getroot()
-            else:
-                root = ET.Element("{%s}Properties" % NAMESPACES["cp"])
-                tree = ET.ElementTree(root)
-
-            existing_names = {prop.get("name") for prop in root.findall("cp:property", NAMESPACES)}
-            pid_start = 2
-            for prop in root.findall("cp:property", NAMESPACES):
-                pid = prop.get("pid")
-                if pid and pid.isdigit():
-                    pid_start = max(pid_start, int(pid) + 1)
-
-            for name, value in metadata.items():
-                if name in existing_names:
-                    # update
-                    prop = root.find(f"cp:property[@name='{name}']", NAMESPACES)
-                    if prop is not None and prop.find("vt:lpwstr", NAMESPACES) is not None:
-                        prop.find("vt:lpwstr", NAMESPACES).text = value
-                    continue
-                prop = ET.SubElement(
-                    root,
-                    "{%s}property" % NAMESPACES["cp"],
-                    {
-                        "fmtid": "{D5CDD505-2E9C-101B-9397-08002B2CF9AE}",
-                        "pid": str(pid_start),
-                        "name": name,
-                    },
+            scale_x = shape_w / region.image_width_px
+            scale_y = shape_h / region.image_height_px
+            left = int(off.get("x")) + int(left_px * scale_x)
+            top = int(off.get("y")) + int(top_px * scale_y)
+            width = int(max(w_px * scale_x, shape_w * 0.25))
+            height = int(max(h_px * scale_y, shape_h * 0.15))
+
+            next_id = next_ids.get(arcname)
+            if next_id is None:
+                next_id = 1 + max(
+                    (int(e.get("id")) for e in root.iter(cnvpr_tag) if e.get("id", "").isdigit()),
+                    default=1,
                 )
-                pid_start += 1
-                lpwstr = ET.SubElement(prop, "{%s}lpwstr" % NAMESPACES["vt"])
-                lpwstr.text = value
-
-            tree.write(props_path, xml_declaration=True, encoding="UTF-8")
-
-            # Repack
-            with zipfile.ZipFile(pptx_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                for folder, _, files in os.walk(tmp_root):
-                    for filename in files:
-                        abs_path = Path(folder) / filename
-                        arcname = abs_path.relative_to(tmp_root)
-                        zf.write(abs_path, arcname=str(arcname).replace(os.sep, "/"))
+            next_ids[arcname] = next_id + 1
+
+            sp = ET.fromstring(_OVERLAY_SP_TEMPLATE)
+            cnvpr = sp.find(_SP_CNVPR_PATH)
+            cnvpr.set("id", str(next_id))
+            cnvpr.set("name", f"pptx_translate_overlay_{region.image_name}")
+            sp_off = sp.find(_PIC_OFF_PATH)
+            sp_off.set("x", str(left))
+            sp_off.set("y", str(top))
+            sp_ext = sp.find(_PIC_EXT_PATH)
+            sp_ext.set("cx", str(width))
+            sp_ext.set("cy", str(height))
+            sp.find(_SP_TEXT_PATH).text = translated
+            sp_tree.append(sp)
+
+    def _custom_properties_payload(self, existing_xml: Optional[bytes], metadata: Dict[str, str]) -> bytes:
+        if existing_xml:
+            root = ET.fromstring(existing_xml)
+        else:
+            root = ET.Element("{%s}Properties" % NAMESPACES["cp"])
+        self._update_custom_properties(root, metadata)
+        return ET.tostring(root, xml_declaration=True, encoding="UTF-8")
+
+    def _update_custom_properties(self, root: "ET.Element", metadata: Dict[str, str]) -> None:
+        # One pass collects both the name->element map and the next free pid,
+        # replacing two findall scans plus a per-name XPath lookup below.
+        existing: Dict[str, "ET.Element"] = {}
+        pid_start = 2
+        for prop in root.iter(_CP_PROPERTY_TAG):
+            existing[prop.get("name")] = prop
+            pid = prop.get("pid")
+            if pid and pid.isdigit():
+                pid_start = max(pid_start, int(pid) + 1)
+
+        for name, value in metadata.items():
+            prop = existing.get(name)
+            if prop is not None:
+                lpwstr = prop.find(_VT_LPWSTR_TAG)
+                if lpwstr is not None:
+                    lpwstr.text = value
+                continue
+            prop = ET.SubElement(
+                root,
+                _CP_PROPERTY_TAG,
+                {
+                    "fmtid": "{D5CDD505-2E9C-101B-9397-08002B2CF9AE}",
+                    "pid": str(pid_start),
+                    "name": name,
+                },
+            )
+            pid_start += 1
+            lpwstr = ET.SubElement(prop, _VT_LPWSTR_TAG)
+            lpwstr.text = value
 
     def _generate_qa_report(self, pptx_path: Path, translated_units: List[TranslatableUnit], run_id: str) -> None:
         issues: List[dict] = []
@@ -581,22 +1070,21 @@ def _extract_top_keywords(texts: Iterable[str], top_n: int = 20) -> List[str]:
 
     counter: Counter[str] = Counter()
     for text in texts:
-        for token in _tokenize(text):
-            counter[token.lower()] += 1
+        counter.update(_tokenize(text))
     most_common = [token for token, _ in counter.most_common(top_n)]
     return most_common
 
 
-def _tokenize(text: str) -> List[str]:
-    clean = []
-    buffer: List[str] = []
-    for ch in text:
-        if ch.isalnum():
-            buffer.append(ch)
-        else:
-            if buffer:
-                clean.append("".join(buffer))
-                buffer = []
-    if buffer:
-        clean.append("".join(buffer))
-    return [t for t in clean if len(t) > 2]
+# Alphanumeric runs of 3+ chars, excluding underscores; one C-level DFA pass
+# replaces the old character-by-character isalnum loop.
+_TOKEN_RE = re.compile(r"[^\W_]{3,}", re.UNICODE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """
+    Tokenize one string, lowercased. Cached because deck text repeats
+    heavily and both the deck profile and glossary generation tokenize the
+    same strings.
+    """
+    return tuple(_TOKEN_RE.findall(text.lower()))
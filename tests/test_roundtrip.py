@@ -22,6 +22,10 @@ def _create_sample_pptx(tmp_path: Path) -> Path:
     textbox = slide.shapes.add_textbox(left=Inches(1), top=Inches(4), width=Inches(3), height=Inches(1))
     textbox.text_frame.text = "Extra box"
 
+    # Letter-free text must survive untouched and never reach the backend.
+    numbox = slide.shapes.add_textbox(left=Inches(1), top=Inches(5), width=Inches(3), height=Inches(1))
+    numbox.text_frame.text = "2024 / 12 — 31%"
+
     slide.notes_slide.notes_text_frame.text = "Note content"
 
     output = tmp_path / "input.pptx"
@@ -81,12 +85,17 @@ def test_round_trip_preserves_layout_and_translates_text(tmp_path: Path, include
     )
     translated_texts = _collect_texts(output_path, include_notes)
 
+    untranslatable = [t for t in original_texts if not any(c.isalpha() for c in t)]
+
     assert _shape_counts(input_path) == _shape_counts(output_path)
     assert len(original_texts) == len(translated_texts)
-    assert len(original_texts) == len(translated_units)
+    assert len(original_texts) == len(translated_units) + len(untranslatable)
 
     for src, tgt in zip(original_texts, translated_texts):
-        assert tgt == f"[de] {src}"
+        if src in untranslatable:
+            assert tgt == src
+        else:
+            assert tgt == f"[de] {src}"
 
     if include_notes:
         out_prs = Presentation(output_path)